@@ -8,8 +8,8 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN, MANUFACTURER, MODEL_EQUALIZER
-from .entity import ChargerEntity
+from .const import DOMAIN
+from .entity import ChargerEntity, build_equalizer_device_info
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -27,6 +27,8 @@ async def async_setup_entry(
 class ChargerBinarySensor(ChargerEntity, BinarySensorEntity):
     """Easee charger binary sensor class."""
 
+    _controller_list_name = "binary_sensor_entities"
+
     @property
     def is_on(self) -> bool:
         """Return true if the binary sensor is on."""
@@ -37,6 +39,8 @@ class ChargerBinarySensor(ChargerEntity, BinarySensorEntity):
 class EqualizerBinarySensor(ChargerEntity, BinarySensorEntity):
     """Easee equalizer binary sensor class."""
 
+    _controller_list_name = "equalizer_binary_sensor_entities"
+
     @property
     def is_on(self) -> bool:
         """Return true if the binary sensor is on."""
@@ -46,11 +50,4 @@ class EqualizerBinarySensor(ChargerEntity, BinarySensorEntity):
     @property
     def device_info(self) -> DeviceInfo:
         """Return the device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.data.product.id)},
-            serial_number=self.data.product.id,
-            name=self.data.product.name,
-            manufacturer=MANUFACTURER,
-            model=MODEL_EQUALIZER,
-            configuration_url=f"https://easee.cloud/mypage/products/{self.data.product.id}",
-        )
+        return build_equalizer_device_info(self.data.product.id, self.data.product.name)
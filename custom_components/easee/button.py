@@ -28,6 +28,8 @@ async def async_setup_entry(
 class ChargerButton(ChargerEntity, ButtonEntity):
     """Easee button class."""
 
+    _controller_list_name = "button_entities"
+
     async def async_press(self) -> None:
         """Press the button."""
         _LOGGER.debug("%s Button press", self._entity_name)
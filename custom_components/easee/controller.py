@@ -954,29 +954,7 @@ class Controller:
             product_data.product.name,
             data["units"],
         )
-        if object_type == "sensor":
-            self.sensor_entities.append(entity)
-
-        elif object_type == "switch":
-            self.switch_entities.append(entity)
-
-        elif object_type == "binary_sensor":
-            self.binary_sensor_entities.append(entity)
-
-        elif object_type == "button":
-            self.button_entities.append(entity)
-
-        elif object_type == "light":
-            self.light_entities.append(entity)
-
-        elif object_type == "eq_sensor":
-            self.equalizer_sensor_entities.append(entity)
-
-        elif object_type == "eq_binary_sensor":
-            self.equalizer_binary_sensor_entities.append(entity)
-
-        elif object_type == "eq_switch":
-            self.equalizer_switch_entities.append(entity)
+        entity.register_owner(self)
 
         return entity
 
@@ -22,12 +22,13 @@ from homeassistant.helpers.typing import ConfigType, TemplateVarsType
 
 from .const import DOMAIN, EASEE_STATUS
 
-CONDITION_TYPES = list(EASEE_STATUS.values())
+CONDITION_TYPES = tuple(dict.fromkeys(EASEE_STATUS.values()))
+CONDITION_TYPES_SET = frozenset(CONDITION_TYPES)
 
 CONDITION_SCHEMA = cv.DEVICE_CONDITION_BASE_SCHEMA.extend(
     {
-        vol.Required(CONF_ENTITY_ID): cv.entity_id,
-        vol.Required(CONF_TYPE): vol.In(CONDITION_TYPES),
+        vol.Required(CONF_ENTITY_ID): cv.entity_id_or_uuid,
+        vol.Required(CONF_TYPE): vol.In(CONDITION_TYPES_SET),
     }
 )
 
@@ -47,11 +48,11 @@ async def async_get_conditions(
                 CONF_CONDITION: "device",
                 CONF_DEVICE_ID: device_id,
                 CONF_DOMAIN: DOMAIN,
-                CONF_ENTITY_ID: entry.entity_id,
+                CONF_ENTITY_ID: entry.id,
             }
-            conditions += [
+            conditions.extend(
                 {**base_condition, CONF_TYPE: cond} for cond in CONDITION_TYPES
-            ]
+            )
 
     return conditions
 
@@ -61,11 +62,13 @@ def async_condition_from_config(
     hass: HomeAssistant, config: ConfigType
 ) -> condition.ConditionCheckerType:
     """Create a function to test a device condition."""
+    registry = er.async_get(hass)
+    entity_id = er.async_resolve_entity_id(registry, config[ATTR_ENTITY_ID])
     state = config[CONF_TYPE]
 
     @callback
     def test_is_state(hass: HomeAssistant, variables: TemplateVarsType) -> bool:
         """Test if an entity is a certain state."""
-        return condition.state(hass, config[ATTR_ENTITY_ID], state)
+        return condition.state(hass, entity_id, state)
 
     return test_is_state
@@ -4,8 +4,13 @@ Author: Niklas Fondberg<niklas.fondberg@gmail.com>.
 """
 
 from collections.abc import Callable
+import contextlib
 from datetime import datetime
+from functools import lru_cache, partial
 import logging
+from operator import attrgetter
+from typing import ClassVar
+import weakref
 
 from homeassistant.const import UnitOfEnergy, UnitOfPower
 from homeassistant.helpers import device_registry as dr, entity_registry as er
@@ -17,25 +22,26 @@ from .const import (
     DOMAIN,
     EASEE_PRODUCT_CODES,
     EASEE_STATUS,
+    MANUFACTURER,
+    MODEL_EQUALIZER,
     PHASE_MODE_STATUS,
     REASON_NO_CURRENT,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+_WH_UNITS: frozenset[str] = frozenset({UnitOfPower.WATT, UnitOfEnergy.WATT_HOUR})
+
 """ TODO Quick fix to handle rounding: Cleanup and collapse later """
 
 
 def round_to_dec(value, decimals=None, unit=None) -> float | int:
     """Round to selected no of decimals."""
-    if unit in (UnitOfPower.WATT, UnitOfEnergy.WATT_HOUR):
-        value = value * 1000
-        decimals = None
-    try:
-        return round(value, decimals)
-    except TypeError:
-        pass
-    return value
+    if not isinstance(value, (int, float)):
+        return value
+    if unit in _WH_UNITS:
+        return round(value * 1000)
+    return round(value, decimals)
 
 
 def round_2_dec(value, unit=None):
@@ -53,19 +59,22 @@ def round_0_dec(value, unit=None):
     return round_to_dec(value, None, unit)
 
 
+@lru_cache(maxsize=64)
 def map_charger_status(value, unit=None):
     """Map charger status."""
-    return EASEE_STATUS.get(value, f"unknown {value}")
+    return EASEE_STATUS.get(value) or f"unknown {value}"
 
 
+@lru_cache(maxsize=64)
 def map_reason_no_current(value, unit=None) -> str:
     """Map reason for no current."""
-    return REASON_NO_CURRENT.get(value, f"unknown {value}")
+    return REASON_NO_CURRENT.get(value) or f"unknown {value}"
 
 
+@lru_cache(maxsize=64)
 def map_phase_mode(value, unit=None) -> str:
     """Map phase mode."""
-    return PHASE_MODE_STATUS.get(value, f"unknown {value}")
+    return PHASE_MODE_STATUS.get(value) or f"unknown {value}"
 
 
 convert_units_funcs = {
@@ -77,10 +86,105 @@ convert_units_funcs = {
     "map_phase_mode": map_phase_mode,
 }
 
+# Data containers addressed by the first part of a key, and whether writes
+# are skipped while the container is still missing (None).
+_CONTAINERS: dict[str, tuple[Callable, bool]] = {
+    "config": (attrgetter("config"), True),
+    "state": (attrgetter("state"), True),
+    "circuit": (attrgetter("circuit"), False),
+    "site": (attrgetter("site"), False),
+    "cost_day": (attrgetter("cost_day"), False),
+    "cost_month": (attrgetter("cost_month"), False),
+    "cost_year": (attrgetter("cost_year"), False),
+    "schedule": (attrgetter("schedule"), True),
+    "weekly_schedule": (attrgetter("weekly_schedule"), True),
+}
+# Containers that read as None while missing; other missing containers raise.
+_OPTIONAL_CONTAINERS = frozenset({"schedule", "weekly_schedule"})
+_SETTABLE_CONTAINERS = frozenset(
+    {"config", "state", "circuit", "site", "schedule", "weekly_schedule"}
+)
+_STATE_FUNC_CONTAINERS = frozenset({"state", "config", "schedule", "weekly_schedule"})
+
+
+def _split_key(key: str) -> tuple[str, str]:
+    """Split a data key into container name and item name."""
+    first, _, second = key.partition(".")
+    return first, second
+
+
+@lru_cache(maxsize=256)
+def _attr_spec(attr_key: str, unit) -> tuple[str, str, str, Callable | None]:
+    """Resolve attribute name, key parts and rounding for an attribute key."""
+    key = attr_key.replace(".", "_")
+    lower_key = key.lower()
+    if "voltage" in lower_key:
+        rounder = round_0_dec
+    elif "current" in lower_key:
+        rounder = round_1_dec
+    elif "cumulative" in lower_key or "power" in lower_key:
+        rounder = partial(round_1_dec, unit=unit)
+    else:
+        rounder = None
+    return (key, *_split_key(attr_key), rounder)
+
+
+@lru_cache(maxsize=256)
+def _friendly_name(entity_name: str) -> str:
+    """Build default entity name from the entity key."""
+    return entity_name.capitalize().replace("_", " ")
+
+
+@lru_cache(maxsize=256)
+def _build_device_info(product_id, product_name, site_id, product_code) -> DeviceInfo:
+    """Build device info shared by all entities of a product."""
+    return DeviceInfo(
+        identifiers={(DOMAIN, product_id)},
+        serial_number=product_id,
+        name=product_name,
+        manufacturer="Easee",
+        model=EASEE_PRODUCT_CODES.get(product_code, f"productCode: {product_code}"),
+        configuration_url=f"https://easee.cloud/sites/{site_id}/products/{product_id}",
+    )
+
+
+@lru_cache(maxsize=256)
+def build_equalizer_device_info(product_id, product_name) -> DeviceInfo:
+    """Build device info shared by all entities of an equalizer."""
+    return DeviceInfo(
+        identifiers={(DOMAIN, product_id)},
+        serial_number=product_id,
+        name=product_name,
+        manufacturer=MANUFACTURER,
+        model=MODEL_EQUALIZER,
+        configuration_url=f"https://easee.cloud/mypage/products/{product_id}",
+    )
+
 
 class ChargerEntity(Entity):
     """Implementation of Easee charger entity."""
 
+    __slots__ = (
+        "data",
+        "_entity_name",
+        "_state_key",
+        "_state_first",
+        "_state_second",
+        "_units",
+        "_convert_units_func",
+        "_attrs_keys",
+        "_attr_specs",
+        "_attr_base",
+        "_state_func",
+        "_state_func_container",
+        "_state",
+        "_switch_func",
+        "_controller",
+    )
+
+    _attr_available = True
+    _controller_list_name: ClassVar[str]
+
     def __init__(
         self,
         data,
@@ -102,12 +206,24 @@ class ChargerEntity(Entity):
         self.data = data
         self._entity_name = name
         self._state_key = state_key
+        self._state_first, self._state_second = _split_key(state_key)
         self._units = units
+        if convert_units_func is not None:
+            convert_units_func = partial(convert_units_func, unit=units)
         self._convert_units_func = convert_units_func
-        self._attrs_keys = attrs_keys
+        self._attrs_keys = tuple(attrs_keys)
+        self._attr_specs = tuple(_attr_spec(attr, units) for attr in attrs_keys)
+        self._attr_base = {
+            "name": self.data.product.name,
+            "id": self.data.product.id,
+        }
         self._state_func = state_func
+        self._state_func_container = None
+        if state_func is not None and self._state_first in _STATE_FUNC_CONTAINERS:
+            self._state_func_container = _CONTAINERS[self._state_first][0]
         self._state = None
         self._switch_func = switch_func
+        self._controller = None
         self._attr_unique_id = f"{self.data.product.id}_{self._entity_name}"
         self._attr_device_class = device_class
         self._attr_translation_key = translation_key
@@ -115,7 +231,7 @@ class ChargerEntity(Entity):
         self._attr_should_poll = False
         self._attr_entity_registry_enabled_default = enabled_default
         if translation_key is None:
-            self._attr_name = f"{self._entity_name}".capitalize().replace("_", " ")
+            self._attr_name = _friendly_name(self._entity_name)
         self._attr_has_entity_name = True
         self._attr_state_class = state_class
         self._attr_entity_category = entity_category
@@ -126,16 +242,11 @@ class ChargerEntity(Entity):
         except AttributeError:
             product_code = None
 
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, self.data.product.id)},
-            serial_number=self.data.product.id,
-            name=self.data.product.name,
-            manufacturer="Easee",
-            model=EASEE_PRODUCT_CODES.get(product_code, f"productCode: {product_code}"),
-            configuration_url=(
-                f"https://easee.cloud/sites/{self.data.site.id}"
-                f"/products/{self.data.product.id}"
-            ),
+        self._attr_device_info = _build_device_info(
+            self.data.product.id,
+            self.data.product.name,
+            self.data.site.id,
+            product_code,
         )
 
         if self._state_key not in self._attrs_keys:
@@ -143,32 +254,25 @@ class ChargerEntity(Entity):
         for attr in self._attrs_keys:
             self.data.register_for_update(attr, self)
 
+    def register_owner(self, controller) -> None:
+        """Add entity to the controller list for its entity kind."""
+        getattr(controller, self._controller_list_name).append(self)
+        self._controller = weakref.ref(controller)
+
     async def async_will_remove_from_hass(self) -> None:
         """Disconnect object when removed."""
-        controller = self.hass.data[DOMAIN]["controller"]
-        if self in controller.sensor_entities:
-            controller.sensor_entities.remove(self)
-        if self in controller.binary_sensor_entities:
-            controller.binary_sensor_entities.remove(self)
-        if self in controller.switch_entities:
-            controller.switch_entities.remove(self)
-        if self in controller.button_entities:
-            controller.button_entities.remove(self)
-        if self in controller.light_entities:
-            controller.light_entities.remove(self)
-        if self in controller.equalizer_sensor_entities:
-            controller.equalizer_sensor_entities.remove(self)
-        if self in controller.equalizer_binary_sensor_entities:
-            controller.equalizer_binary_sensor_entities.remove(self)
-        if self in controller.equalizer_switch_entities:
-            controller.equalizer_switch_entities.remove(self)
+        controller = self._controller() if self._controller is not None else None
+        if controller is not None:
+            with contextlib.suppress(ValueError):
+                getattr(controller, self._controller_list_name).remove(self)
         ent_reg = er.async_get(self.hass)
         entity_entry = ent_reg.async_get(self.entity_id)
 
         dev_reg = dr.async_get(self.hass)
         device_entry = dev_reg.async_get(entity_entry.device_id)
 
-        _LOGGER.debug("Removing _entity_name: %s", self._entity_name)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Removing _entity_name: %s", self._entity_name)
         if self.data.site.name in self.hass.data[DOMAIN]["sites_to_remove"]:
             if len(async_entries_for_device(ent_reg, entity_entry.device_id)) == 1:
                 dev_reg.async_remove_device(device_entry.id)
@@ -176,31 +280,16 @@ class ChargerEntity(Entity):
 
             ent_reg.async_remove(self.entity_id)
 
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return True
-
     @property
     def extra_state_attributes(self) -> dict:
         """Return the extra state attributes."""
         try:
-            attrs = {
-                "name": self.data.product.name,
-                "id": self.data.product.id,
-            }
-            for attr_key in self._attrs_keys:
-                key = attr_key.replace(".", "_")
-                if "voltage" in key.lower():
-                    attrs[key] = round_0_dec(self.get_value_from_key(attr_key))
-                elif "current" in key.lower():
-                    attrs[key] = round_1_dec(self.get_value_from_key(attr_key))
-                elif "cumulative" in key.lower() or "power" in key.lower():
-                    attrs[key] = round_1_dec(
-                        self.get_value_from_key(attr_key), self._units
-                    )
-                else:
-                    attrs[key] = self.get_value_from_key(attr_key)
+            attrs = self._attr_base.copy()
+            for key, first, second, rounder in self._attr_specs:
+                value = self._get_value(first, second)
+                if rounder is not None:
+                    value = rounder(value)
+                attrs[key] = value
 
             return attrs
         except TypeError:
@@ -208,90 +297,60 @@ class ChargerEntity(Entity):
         except IndexError:
             return {}
 
+    def _get_container(self, first):
+        """Get the data container for the first part of a key."""
+        entry = _CONTAINERS.get(first)
+        if entry is None:
+            _LOGGER.error("Unknown first part of key: %s", first)
+            raise IndexError("Unknown first part of key")
+        getter, skip_missing = entry
+        return getter(self.data), skip_missing
+
     def set_value_from_key(self, key, value):
         """Set value from key."""
-        first, second = key.split(".")
-        if first == "config":
-            if self.data.config is not None:
-                self.data.config[second] = value
-        elif first == "state":
-            if self.data.state is not None:
-                self.data.state[second] = value
-        elif first == "circuit":
-            self.data.circuit[second] = value
-        elif first == "site":
-            self.data.site[second] = value
-        elif first == "schedule":
-            if self.data.schedule is not None:
-                self.data.schedule[second] = value
-        elif first == "weekly_schedule":
-            if self.data.weekly_schedule is not None:
-                self.data.weekly_schedule[second] = value
-        else:
+        first, second = _split_key(key)
+        if first not in _SETTABLE_CONTAINERS:
             _LOGGER.error("Unknown first part of key: %s", key)
             raise IndexError("Unknown first part of key")
+        container, skip_missing = self._get_container(first)
+        if not skip_missing or container is not None:
+            container[second] = value
 
         return value
 
     def get_value_from_key(self, key):
         """Get value from key."""
-        try:
-            first, second = key.split(".")
-            value = None
-            if first == "config":
-                value = self.data.config[second]
-            elif first == "state":
-                value = self.data.state[second]
-            elif first == "circuit":
-                value = self.data.circuit[second]
-            elif first == "site":
-                value = self.data.site[second]
-            elif first == "cost_day":
-                value = self.data.cost_day[second]
-            elif first == "cost_month":
-                value = self.data.cost_month[second]
-            elif first == "cost_year":
-                value = self.data.cost_year[second]
-            elif first == "schedule":
-                if self.data.schedule is not None:
-                    value = self.data.schedule[second]
-            elif first == "weekly_schedule":
-                if self.data.weekly_schedule is not None:
-                    value = self.data.weekly_schedule[second]
-            else:
-                _LOGGER.error("Unknown first part of key: %s", key)
-                raise IndexError("Unknown first part of key")
-
-            if isinstance(value, datetime):
-                value = dt_util.as_local(value)
-        except KeyError:
-            value = ""
-
+        return self._get_value(*_split_key(key))
+
+    def _get_value(self, first, second):
+        """Get value from a pre-split key."""
+        container, _ = self._get_container(first)
+        if container is None:
+            if first in _OPTIONAL_CONTAINERS:
+                return None
+            raise TypeError(f"Missing data container: {first}")
+        value = container.get(second, "")
+        if isinstance(value, datetime):
+            value = dt_util.as_local(value)
         return value
 
     async def async_update(self) -> None:
         """Get the latest data and update the state."""
-        _LOGGER.debug(
-            "Entity async_update : %s %s",
-            self.data.product.id,
-            self._entity_name,
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Entity async_update : %s %s",
+                self.data.product.id,
+                self._entity_name,
+            )
         self._state = None
         try:
-            self._state = self.get_value_from_key(self._state_key)
+            self._state = self._get_value(self._state_first, self._state_second)
             if self._state == "":
                 self._state = None
-            if self._state_func is not None:
-                if self._state_key.startswith("state"):
-                    self._state = self._state_func(self.data.state)
-                if self._state_key.startswith("config"):
-                    self._state = self._state_func(self.data.config)
-                if self._state_key.startswith("schedule"):
-                    self._state = self._state_func(self.data.schedule)
-                if self._state_key.startswith("weekly_schedule"):
-                    self._state = self._state_func(self.data.weekly_schedule)
+            if self._state_func_container is not None:
+                self._state = self._state_func(self._state_func_container(self.data))
             if self._convert_units_func is not None:
-                self._state = self._convert_units_func(self._state, self._units)
+                self._state = self._convert_units_func(self._state)
 
         except IndexError as exc:
             raise IndexError(f"Wrong key for entity: {self._state_key}") from exc
@@ -28,6 +28,8 @@ async def async_setup_entry(
 class ChargerLight(ChargerEntity, LightEntity):
     """Easee light class."""
 
+    _controller_list_name = "light_entities"
+
     _attr_color_mode = ColorMode.BRIGHTNESS
     _attr_supported_color_modes = [ColorMode.BRIGHTNESS]
 
@@ -13,8 +13,8 @@ from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import StateType
 
-from .const import DOMAIN, MANUFACTURER, MODEL_EQUALIZER
-from .entity import ChargerEntity
+from .const import DOMAIN
+from .entity import ChargerEntity, build_equalizer_device_info
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -34,6 +34,8 @@ async def async_setup_entry(
 class ChargerSensor(ChargerEntity, SensorEntity):
     """Implementation of Easee charger sensor."""
 
+    _controller_list_name = "sensor_entities"
+
     @property
     def native_value(self) -> StateType:
         """Return native value of sensor."""
@@ -63,6 +65,8 @@ class ChargerSensor(ChargerEntity, SensorEntity):
 class EqualizerSensor(ChargerEntity, SensorEntity):
     """Implementation of Easee equalizer sensor."""
 
+    _controller_list_name = "equalizer_sensor_entities"
+
     @property
     def native_value(self) -> StateType:
         """Return native value of sensor."""
@@ -71,11 +75,4 @@ class EqualizerSensor(ChargerEntity, SensorEntity):
     @property
     def device_info(self) -> DeviceInfo:
         """Return the device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.data.product.id)},
-            serial_number=self.data.product.id,
-            name=self.data.product.name,
-            manufacturer=MANUFACTURER,
-            model=MODEL_EQUALIZER,
-            configuration_url=f"https://easee.cloud/mypage/products/{self.data.product.id}",
-        )
+        return build_equalizer_device_info(self.data.product.id, self.data.product.name)
@@ -10,8 +10,8 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN, MANUFACTURER, MODEL_EQUALIZER
-from .entity import ChargerEntity
+from .const import DOMAIN
+from .entity import ChargerEntity, build_equalizer_device_info
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -29,6 +29,8 @@ async def async_setup_entry(
 class ChargerSwitch(ChargerEntity, SwitchEntity):
     """Easee switch class."""
 
+    _controller_list_name = "switch_entities"
+
     async def async_turn_on(self, **kwargs) -> None:
         """Turn on the switch."""
         _LOGGER.debug("%s Switch turn on", self._entity_name)
@@ -71,14 +73,9 @@ class ChargerSwitch(ChargerEntity, SwitchEntity):
 class EqualizerSwitch(ChargerSwitch):
     """Easee equalizer switch class."""
 
+    _controller_list_name = "equalizer_switch_entities"
+
     @property
     def device_info(self) -> DeviceInfo:
         """Return the device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.data.product.id)},
-            serial_number=self.data.product.id,
-            name=self.data.product.name,
-            manufacturer=MANUFACTURER,
-            model=MODEL_EQUALIZER,
-            configuration_url=f"https://easee.cloud/mypage/products/{self.data.product.id}",
-        )
+        return build_equalizer_device_info(self.data.product.id, self.data.product.name)
@@ -0,0 +1,74 @@
+"""Tests for the Easee charger base entity."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("homeassistant")
+pytest.importorskip("pyeasee")
+
+from custom_components.easee.entity import (  # noqa: E402
+    ChargerEntity,
+    map_charger_status,
+)
+
+
+def _product_data(**containers):
+    """Return product data that has not been polled yet."""
+    data = SimpleNamespace(
+        product=SimpleNamespace(id="EH123456", name="Charger", product_code=1),
+        site=SimpleNamespace(id=1),
+        circuit=None,
+        state=None,
+        config=None,
+        schedule=None,
+        weekly_schedule=None,
+        register_for_update=lambda name, entity: None,
+    )
+    for name, container in containers.items():
+        setattr(data, name, container)
+    return data
+
+
+def _entity(data, state_key, attrs_keys=(), convert_units_func=None):
+    return ChargerEntity(
+        data=data,
+        name="status",
+        state_key=state_key,
+        units=None,
+        convert_units_func=convert_units_func,
+        attrs_keys=list(attrs_keys),
+        device_class=None,
+    )
+
+
+def test_update_with_missing_state_keeps_state_none():
+    """A state key read before the first poll leaves the state unset."""
+    entity = _entity(
+        _product_data(),
+        "state.chargerOpMode",
+        convert_units_func=map_charger_status,
+    )
+
+    asyncio.run(entity.async_update())
+
+    assert entity._state is None
+
+
+def test_update_with_missing_schedule_reads_none():
+    """A missing schedule reads as None instead of failing."""
+    entity = _entity(_product_data(), "schedule.isEnabled")
+
+    assert entity.get_value_from_key("schedule.isEnabled") is None
+
+
+def test_attributes_with_missing_container_are_empty():
+    """Attributes fall back to an empty dict while data is missing."""
+    entity = _entity(
+        _product_data(state={"chargerOpMode": 3}),
+        "state.chargerOpMode",
+        attrs_keys=("state.voltage", "circuit.id"),
+    )
+
+    assert entity.extra_state_attributes == {}